@@ -6,13 +6,19 @@ import logging
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigType
-from homeassistant.const import CONF_DEVICE_ID, CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import Event, HomeAssistant
 import homeassistant.helpers.config_validation as cv
 
 from .const import DOMAIN
+from .coordinator import RyobiCoordinator
 from .gdodevice import GdoDevice
-from .ryobiapi import RyobiApi
+from .ryobiapi import RyobiApi, RyobiWssCtrl
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +46,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         config[DOMAIN].get(CONF_USERNAME), config[DOMAIN].get(CONF_PASSWORD)
     )
 
+    async def async_shutdown(event: Event) -> None:
+        """Close the Ryobi HTTP and websocket sessions on Home Assistant stop."""
+        await ryobi_api.aclose()
+        for wss_ctrl in {garage_device.wss for garage_device in hass.data[DOMAIN]}:
+            await wss_ctrl.close_wss()
+            await wss_ctrl.aclose()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_shutdown)
+
     _LOGGER.debug("RyobiApi login started")
     login_result = await ryobi_api.login()
 
@@ -52,11 +67,19 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         _LOGGER.error("Ryobi component was unable to find any devices. Failed to setup")
         return False
 
+    wss_ctrl = RyobiWssCtrl(
+        config[DOMAIN].get(CONF_USERNAME),
+        config[DOMAIN].get(CONF_PASSWORD),
+        ryobi_api.api_key,
+        ryobi_api.user_id,
+    )
+
     for device in devices:
         _LOGGER.info(
             "Found device name: %s | Device Id: %s", device["name"], device["u_id"]
         )
         garage_device = GdoDevice(
+            wss_ctrl,
             config[DOMAIN].get(CONF_USERNAME),
             config[DOMAIN].get(CONF_PASSWORD),
             device["api_key"],
@@ -71,6 +94,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass.data[DOMAIN].append(garage_device)
 
     if hass.data[DOMAIN]:
+        coordinator = RyobiCoordinator(hass, ryobi_api, hass.data[DOMAIN])
+        await coordinator.async_refresh()
+
         _LOGGER.debug("Starting Ryobi GDO components")
         hass.helpers.discovery.load_platform("cover", DOMAIN, {}, config)
     return True
@@ -1,3 +1,10 @@
 """Constants for the Ryobi Garage Door Opener integration."""
 
 DOMAIN = "ryobi_garage"
+
+# Garage door "doorState" attribute values
+DOOR_STATE_CLOSED = 0
+DOOR_STATE_OPEN = 1
+DOOR_STATE_CLOSING = 2
+DOOR_STATE_OPENING = 3
+DOOR_STATE_FAULT = 4
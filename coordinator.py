@@ -0,0 +1,58 @@
+"""Data update coordinator for the Ryobi Garage Door Opener integration."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .const import DOMAIN
+from .gdodevice import GdoDevice
+from .ryobiapi import RyobiApi
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RyobiCoordinator(DataUpdateCoordinator):
+    """
+    Poll the status of every Ryobi device of an account in a single update
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: RyobiApi,
+        devices: list[GdoDevice],
+        update_interval: timedelta = timedelta(seconds=60),
+    ) -> None:
+        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval)
+
+        self.api = api
+        self.devices = devices
+        for device in devices:
+            device.coordinator = self
+
+    async def _async_update_data(self) -> dict[str, dict]:
+        """Fetch the status of all devices concurrently"""
+        device_type_maps = await asyncio.gather(
+            *(self.api.get_device_status(device.device_id) for device in self.devices)
+        )
+        if not any(device_type_maps):
+            raise UpdateFailed("Unable to get the status of any Ryobi device")
+
+        for device, device_type_map in zip(self.devices, device_type_maps):
+            if device_type_map:
+                device.update_from_device_type_map(device_type_map)
+        return {device.device_id: dict(device.status) for device in self.devices}
+
+    @callback
+    def async_update_device(self, device: GdoDevice) -> None:
+        """Push a device status received over the websocket to the entities"""
+        self.async_set_updated_data(
+            {**(self.data or {}), device.device_id: dict(device.status)}
+        )
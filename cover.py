@@ -1,10 +1,21 @@
+import asyncio
 import logging
 
-from homeassistant.components.cover import CoverEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.components.cover import (
+    CoverDeviceClass,
+    CoverEntity,
+    CoverEntityFeature,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import ConfigType, entity_platform
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN
+from .const import (
+    DOMAIN,
+    DOOR_STATE_CLOSED,
+    DOOR_STATE_CLOSING,
+    DOOR_STATE_OPENING,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,18 +27,61 @@ async def async_setup_platform(
     discovery_info=None,
 ) -> None:
     """Set up the Ryobi garage door openers."""
-    garage_devices = []
-    for device in hass.data[DOMAIN]:
-        garage_devices.append(RyobiGarageDoor(device))
-        hass.loop.create_task(device.watch_state())
+    garage_devices = [RyobiGarageDoor(device) for device in hass.data[DOMAIN]]
 
     _LOGGER.debug("Adding Ryobi Garage Door to Home Assistant: %s", garage_devices)
     async_add_entities(garage_devices, False)
 
+    # Devices of the same account share one websocket, open each of them concurrently
+    wss_ctrls = {device.wss for device in hass.data[DOMAIN]}
+    await asyncio.gather(*(wss_ctrl.connect_wss() for wss_ctrl in wss_ctrls))
 
-class RyobiGarageDoor(CoverEntity):
+
+class RyobiGarageDoor(CoordinatorEntity, CoverEntity):
     """
     Ryobi Garage Door Opener
     """
 
-    hi = "hi"
+    _attr_device_class = CoverDeviceClass.GARAGE
+    # Door commands are not implemented yet, the entity only reports state
+    _attr_supported_features = CoverEntityFeature(0)
+
+    def __init__(self, device) -> None:
+        super().__init__(device.coordinator)
+        self._device = device
+        self._state: dict = {}
+
+        self._attr_name = device.name
+        self._attr_unique_id = device.device_id
+
+        if self.coordinator.data:
+            self._state = self.coordinator.data.get(device.device_id, {})
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the device status once per update for the property lookups"""
+        self._state = self.coordinator.data.get(self._device.device_id, {})
+        self.async_write_ha_state()
+
+    @property
+    def is_closed(self) -> bool | None:
+        """Return if the garage door is closed"""
+        door_state = self._state.get("doorState")
+        if door_state is None:
+            return None
+        return door_state == DOOR_STATE_CLOSED
+
+    @property
+    def is_closing(self) -> bool:
+        """Return if the garage door is closing"""
+        return self._state.get("doorState") == DOOR_STATE_CLOSING
+
+    @property
+    def is_opening(self) -> bool:
+        """Return if the garage door is opening"""
+        return self._state.get("doorState") == DOOR_STATE_OPENING
+
+    @property
+    def current_cover_position(self) -> int | None:
+        """Return the garage door position, 0 is closed and 100 is open"""
+        return self._state.get("doorPosition")
@@ -4,14 +4,17 @@ from .ryobiapi import RyobiWssCtrl
 
 _LOGGER = logging.getLogger(__name__)
 
+GARAGE_DOOR_MODULE = "garageDoor"
 
-class GdoDevice(RyobiWssCtrl):
+
+class GdoDevice:
     """
     A representation of the Ryobi Device to listen to WS.
     """
 
     def __init__(
         self,
+        wss: RyobiWssCtrl,
         username,
         password,
         api_key,
@@ -25,7 +28,6 @@ class GdoDevice(RyobiWssCtrl):
         status=None,
     ) -> None:
         _LOGGER.debug("Ryobi GDODevice __init__")
-        super().__init__(username, password, api_key, u_id, d_id)
 
         self.username = username
         self.password = password
@@ -40,16 +42,32 @@ class GdoDevice(RyobiWssCtrl):
         self.last_seen = last_seen
 
         # if self.status is None: #from https://github.com/Jezza34000/homeassistant_weback_component/blob/bc2ac510515392e8f22c6a74abc99f7442084722/custom_components/weback_vacuum/VacDevice.py#L18
-        self.status = status
+        self.status = status or {}
+        self.coordinator = None
+
+        # All devices of an account share the same websocket connection
+        self.wss = wss
+        self.wss.subscriber.append(self)
+
+    def update_from_device_type_map(self, device_type_map):
+        """
+        Update the garage door attributes from the HTTP device type map
+        """
+        for module, module_data in device_type_map.items():
+            if module.startswith(GARAGE_DOOR_MODULE):
+                for attr, attr_data in module_data.get("at", {}).items():
+                    self.status[attr] = attr_data.get("value")
 
-    async def watch_state(self):
+    def update(self, wss_data):
         """
-        State watcher from VacDevice
+        Handle a websocket message addressed to this device
         """
-        _LOGGER.debug(
-            "GdoDevice: starting state watcher for= %s %s", self.name, self.device_id
-        )
-        try:
-            await self.refresh_handler(self.device_id)
-        except:
-            _LOGGER.exception("Error on watch_state starting refresh_handler")
+        for key, value in wss_data["params"].items():
+            module, _, attr = key.partition(".")
+            if not attr or not isinstance(value, dict):
+                continue
+            if module.startswith(GARAGE_DOOR_MODULE):
+                self.status[attr] = value.get("value")
+
+        if self.coordinator is not None:
+            self.coordinator.async_update_device(self)
@@ -1,10 +1,24 @@
 import asyncio
 import json
 import logging
-import threading
+import random
 
 import httpx
-import websocket
+import websockets
+
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        """Serialize obj to a JSON string with orjson"""
+        # Ryobi's JSON-RPC endpoint expects text frames, sending the raw bytes
+        # would make websockets emit a binary frame instead
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +41,23 @@ WS_ENDPOINT = f"{WS_URL}/api/wsrpc"
 N_RETRY = 6
 ACK_TIMEOUT = 5
 HTTP_TIMEOUT = 5
+WSS_CONNECT_TIMEOUT = 7.5
+WSS_OPEN_TIMEOUT = 5
+WSS_PING_INTERVAL = 20
+PUBLISH_TIMEOUT = 30
+# WSS reconnect backoff
+BACKOFF_INITIAL = 5
+BACKOFF_MIN = 1.92
+BACKOFF_FACTOR = 1.618
+BACKOFF_MAX = 60.0
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 30.0
+
+
+def retry_delay(attempt):
+    """Truncated exponential backoff with jitter for the given retry attempt"""
+    delay = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2**attempt))
+    return delay * (1 + random.random() * 0.5)
 
 
 class RyobiApi:
@@ -35,30 +66,31 @@ class RyobiApi:
     Handle connexion with Ryobi's server to get WSS credentials
     """
 
+    _HEADERS = {
+        "host": RYOBI_URL,
+        "content-type": "application/json",
+    }
+
     def __init__(self, username, password):
         _LOGGER.debug("RyobiApi __init__")
 
         self.username = username
         self.password = password
+        self._auth_params = {"username": username, "password": password}
 
         self.api_key = None
         self.user_id = None
         self.devices = []
 
+        self._client: httpx.AsyncClient | None = None
+
     async def login(self, url=f"{HTTP_ENDPOINT}/login") -> bool:
         """ "
         Login to Ryobi platform
         """
         _LOGGER.debug("RyobiApi try login")
 
-        params = {"username": self.username, "password": self.password}
-
-        headers = {
-            "host": RYOBI_URL,
-            "content-type": "application/json",
-        }
-
-        resp = await self.send_http(url, params, headers)
+        resp = await self.send_http(url, self._auth_params)
 
         if "_id" in resp["result"]:
             self.user_id = resp["result"]["_id"]
@@ -86,30 +118,25 @@ class RyobiApi:
         """
         _LOGGER.debug("RyobiApi get list of devices")
 
-        params = {"username": self.username, "password": self.password}
-
-        headers = {
-            "host": RYOBI_URL,
-            "content-type": "application/json",
-        }
-
-        resp = await self.send_http(url, params, headers, "GET")
+        resp = await self.send_http(url, self._auth_params, "GET")
 
         if resp:  # list not empty
             for result in resp["result"]:
-                device = {}
-                device["username"] = self.username
-                device["password"] = self.password
-                device["api_key"] = self.api_key
-                device["u_id"] = self.user_id
-
-                device["type_ids"] = result["deviceTypeIds"]
-                device["d_id"] = result["varName"]
-                device["name"] = result["metaData"]["name"]
-                device["version"] = result["metaData"]["version"]
-                device["description"] = result["metaData"]["description"]
-                device["last_seen"] = result["metaData"]["sys"]["lastSeen"]
-                self.devices.append(device)
+                meta_data = result["metaData"]
+                self.devices.append(
+                    {
+                        "username": self.username,
+                        "password": self.password,
+                        "api_key": self.api_key,
+                        "u_id": self.user_id,
+                        "type_ids": result["deviceTypeIds"],
+                        "d_id": result["varName"],
+                        "name": meta_data["name"],
+                        "version": meta_data["version"],
+                        "description": meta_data["description"],
+                        "last_seen": meta_data["sys"]["lastSeen"],
+                    }
+                )
 
             _LOGGER.debug(
                 "RyobiApi: Get device list OK. %s devices found", len(self.devices)
@@ -119,39 +146,76 @@ class RyobiApi:
             _LOGGER.error("RyobiApi: FAILED to get device list: %s", resp)
             return []
 
-    @staticmethod
-    async def send_http(url, params, headers, method="POST"):
+    async def get_device_status(self, device_id):
+        """
+        Get the current attribute map of a device from Ryobi server
+        """
+        _LOGGER.debug("RyobiApi get status of device %s", device_id)
+
+        url = f"{HTTP_ENDPOINT}/devices/{device_id}"
+        resp = await self.send_http(url, self._auth_params, "GET")
+
+        if resp.get("result"):
+            return resp["result"][0]["deviceTypeMap"]
+
+        _LOGGER.error("RyobiApi: FAILED to get device status: %s", resp)
+        return None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, creating it on first use
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(HTTP_TIMEOUT, connect=15.0),
+                headers=self._HEADERS,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+            )
+        return self._client
+
+    async def aclose(self):
+        """
+        Close the shared HTTP client
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def send_http(self, url, params, method="POST"):
         """
         Send HTTP request
         """
-        _LOGGER.debug("Send HTTP request Url=%s Params=%s", url, params)
-        timeout = httpx.Timeout(HTTP_TIMEOUT, connect=15.0)
-        request = httpx.Request(method, url, params=params, headers=headers)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Send HTTP request Url=%s Params=%s", url, params)
+        client = await self._get_client()
+        # Headers come from the client defaults, the request is reused by every attempt
+        request = client.build_request(method, url, params=params)
         for attempt in range(N_RETRY):
             try:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    resp = await client.send(request)
-                    if resp.status_code == 200:
-                        # Server status OK
+                resp = await client.send(request)
+                if resp.status_code == 200:
+                    # Server status OK
+                    data = resp.json()
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
                         _LOGGER.debug("RyobiApi: Send HTTP OK, return=200")
-                        _LOGGER.debug("RyobiApi: HTTP data received = %s", resp.json())
-                        return resp.json()
-                    elif resp.status_code == 401:
-                        _LOGGER.error(
-                            "RyobiApi: Invlaid login credentials. HTTP 401 Unauthorized. Skipping retry"
-                        )
-                        return {
-                            "msg": "error",
-                            "details": "Invalid login credentials HTTP 401 Unothorized. Skipped retry",
-                        }
-                    else:
-                        # Server status NOK
-                        _LOGGER.warning(
-                            "RyobiApi: Bad server response (status code=%s) retry... (%s/%s)",
-                            resp.status_code,
-                            attempt,
-                            N_RETRY,
-                        )
+                        _LOGGER.debug("RyobiApi: HTTP data received = %s", data)
+                    return data
+                elif resp.status_code == 401:
+                    _LOGGER.error(
+                        "RyobiApi: Invlaid login credentials. HTTP 401 Unauthorized. Skipping retry"
+                    )
+                    return {
+                        "msg": "error",
+                        "details": "Invalid login credentials HTTP 401 Unothorized. Skipped retry",
+                    }
+                else:
+                    # Server status NOK
+                    _LOGGER.warning(
+                        "RyobiApi: Bad server response (status code=%s) retry... (%s/%s)",
+                        resp.status_code,
+                        attempt,
+                        N_RETRY,
+                    )
             except httpx.RequestError as err:
                 _LOGGER.debug(
                     "Send HTTP exception details=%s retry... (%s/%s)",
@@ -160,6 +224,9 @@ class RyobiApi:
                     N_RETRY,
                 )
 
+            if attempt < N_RETRY - 1:
+                await asyncio.sleep(retry_delay(attempt))
+
         _LOGGER.error("RyobiApi: HTTP error after %s retry", N_RETRY)
         return {"msg": "error", "details": f"Failed after {N_RETRY} retry"}
 
@@ -170,19 +237,25 @@ class RyobiWssCtrl(RyobiApi):
     Handle websocket to send/recieve garage door control and information
     """
 
-    def __init__(self, username, password, api_key, u_id, d_id):
+    def __init__(self, username, password, api_key, u_id):
         super().__init__(username, password)
         _LOGGER.debug("RyobiApi WSS Control __init__")
 
         self.socket_state = SOCK_CLOSE
         self.device_status = None
         self.subscriber = []
-        self.wst = None
         self.ws = None
-        self._refresh_time = 60
+        self._ws_task = None
+        self._stopping = False
+        self._session_healthy = False
+        self._connected_evt = asyncio.Event()
+        self._reconnect_lock = asyncio.Lock()
+        self._auth_payload: tuple[str, str] | None = None
+        self._subscribe_payloads: dict[str, str] = {}
         self.sent_counter = 0
 
         self.api_key = api_key
+        self.user_id = u_id
 
     async def check_credentials(self):
         """
@@ -198,69 +271,150 @@ class RyobiWssCtrl(RyobiApi):
         _LOGGER.debug("RyobiApi (WSS) api_key are OK")
         return True
 
-    async def open_wss_thread(self):
+    async def _run_ws(self):
         """
-        Connect WebSocket to Ryobi Server and create a thread to maintain connection alive
+        Connect WebSocket to Ryobi Server and dispatch incoming messages until it closes
         """
-        if not await self.check_credentials():
-            _LOGGER.error("RyobiApi (WSS) Failed to obtain WSS Api Key")
-            return False
-
         _LOGGER.debug("RyobiApi (WSS) Addr=%s / Api Key=%s", WS_ENDPOINT, self.api_key)
 
-        try:
-            self.ws = websocket.WebSocketApp(
-                WS_ENDPOINT,
-                header={
-                    "Connection": "keep-alive, Upgrade",
-                    "handshakeTimeout": "10000",
-                },
-                on_message=self.on_message,
-                on_close=self.on_close,
-                on_open=self.on_open,
-                on_error=self.on_error,
-                on_pong=self.on_pong,
-            )
-
-            self.authenticate()
-
-            self.subscribe()
-
-            self.wst = threading.Thread(target=self.ws.run_forever)
-            self.wst.start()
-
-            if self.wst.is_alive():
-                _LOGGER.debug("RyobiApi (WSS) Thread was init")
-                return True
+        # websockets sends its own "Connection: Upgrade" header, and the
+        # handshake timeout is a client option rather than a header
+        async with websockets.connect(
+            WS_ENDPOINT,
+            open_timeout=WSS_OPEN_TIMEOUT,
+            ping_interval=WSS_PING_INTERVAL,
+        ) as ws:
+            self.ws = ws
+            try:
+                await self.on_open()
+                async for message in ws:
+                    await self.on_message(message)
+            except websockets.ConnectionClosed as err:
+                _LOGGER.debug("RyobiApi (WSS) Connection lost: %s", err)
+            finally:
+                self.on_close(ws.close_code, ws.close_reason)
+
+    async def _supervisor(self):
+        """
+        Keep the websocket connection alive, reconnecting with truncated
+        exponential backoff while the server can't be reached
+        """
+        backoff_delay = BACKOFF_MIN
+        while not self._stopping:
+            self._session_healthy = False
+            try:
+                await self._run_ws()
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                websockets.WebSocketException,
+            ) as err:
+                self.on_error(err)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("RyobiApi (WSS) Unexpected error in connection")
+                self.socket_state = SOCK_ERROR
+
+            if self._stopping:
+                break
+            # Only a session the server actually talked on resets the backoff,
+            # a peer accepting the handshake then dropping us keeps backing off
+            if self._session_healthy:
+                backoff_delay = BACKOFF_MIN
+            if backoff_delay == BACKOFF_MIN:
+                await asyncio.sleep(random.random() * BACKOFF_INITIAL)
             else:
-                _LOGGER.error("RyobiApi (WSS) Thread connection init has FAILED")
-                return False
-
-        except websocket.WebSocketException as err:
-            self.socket_state = SOCK_ERROR
-            _LOGGER.debug("RyobiApi (WSS) Error while opening socket: %s", err)
-            return False
+                await asyncio.sleep(backoff_delay)
+            backoff_delay = min(backoff_delay * BACKOFF_FACTOR, BACKOFF_MAX)
 
-    async def connect_wss(self):
+    async def connect_wss(self, timeout=WSS_CONNECT_TIMEOUT):
         """Connect to websocket"""
         if self.socket_state == SOCK_CONNECTED:
             return True
 
-        _LOGGER.debug("RyobiApi (WSS) Not connected, connecting")
+        # Only starting the supervisor is serialized, every caller then waits
+        # on the same connection attempt
+        async with self._reconnect_lock:
+            if self._ws_task is None or self._ws_task.done():
+                _LOGGER.debug("RyobiApi (WSS) Not connected, connecting")
 
-        if await self.open_wss_thread():
-            _LOGGER.debug("RyobiApi (WSS) Connecting")
-        else:
+                if not await self.check_credentials():
+                    _LOGGER.error("RyobiApi (WSS) Failed to obtain WSS Api Key")
+                    return False
+
+                self._stopping = False
+                self._connected_evt.clear()
+                self._ws_task = asyncio.create_task(self._supervisor())
+
+        try:
+            await asyncio.wait_for(self._connected_evt.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            _LOGGER.debug("RyobiApi (WSS) Timed out awaiting connection established")
             return False
+        return True
 
-        for i in range(15):
-            _LOGGER.debug("RyobiApi (WSS) awaiting connection established... %s", i)
-            if self.socket_state == SOCK_CONNECTED:
-                return True
-            await asyncio.sleep(0.5)
-        return False
+    async def close_wss(self):
+        """Stop the websocket connection and its supervisor"""
+        self._stopping = True
+        if self._ws_task is not None:
+            self._ws_task.cancel()
+            try:
+                await self._ws_task
+            except asyncio.CancelledError:
+                pass
+            self._ws_task = None
+        self.ws = None
+        self.socket_state = SOCK_CLOSE
+        self._connected_evt.clear()
 
-    def on_error(self, ws, error):
+    def _drop_ws(self):
+        """
+        Abort the current connection without a closing handshake, a stalled peer
+        would hold ws.close() for several close timeouts. on_close then runs and
+        the supervisor redials
+        """
+        self.socket_state = SOCK_CLOSE
+        self._connected_evt.clear()
+        if self.ws is not None:
+            self.ws.transport.abort()
+
+    async def reconnect(self, timeout=WSS_CONNECT_TIMEOUT):
+        """Drop the current connection and wait for the supervisor to reopen it"""
+        self._drop_ws()
+        return await self.connect_wss(timeout)
+
+    async def authenticate(self):
+        """Authenticate the websocket session with the user's api key"""
+        # The payload only changes if a new api key is obtained from login
+        if self._auth_payload is None or self._auth_payload[0] != self.api_key:
+            self._auth_payload = (
+                self.api_key,
+                json_dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": 3,
+                        "method": "srvWebSocketAuth",
+                        "params": {"varName": self.username, "apiKey": self.api_key},
+                    }
+                ),
+            )
+        await self.ws.send(self._auth_payload[1])
+
+    async def subscribe(self):
+        """Subscribe to attribute updates of every subscribed device"""
+        for sub in self.subscriber:
+            payload = self._subscribe_payloads.get(sub.device_id)
+            if payload is None:
+                payload = json_dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": "wskSubscribe",
+                        "params": {"topic": f"{sub.device_id}.wskAttributeUpdateNtfy"},
+                    }
+                )
+                self._subscribe_payloads[sub.device_id] = payload
+            await self.ws.send(payload)
+
+    def on_error(self, error):
         """Socket "On_Error" event"""
         details = ""
         if error:
@@ -268,7 +422,7 @@ class RyobiWssCtrl(RyobiApi):
         _LOGGER.debug("RyobiApi (WSS) Error: %s", details)
         self.socket_state = SOCK_ERROR
 
-    def on_close(self, ws, close_status_code, close_msg):
+    def on_close(self, close_status_code, close_msg):
         """Socket "On_Close" event"""
         _LOGGER.debug("RyobiApi (WSS) Closed")
 
@@ -278,58 +432,103 @@ class RyobiWssCtrl(RyobiApi):
             )
             _LOGGER.debug("RyobiApi (WSS) Close Message: %s", str(close_msg))
         self.socket_state = SOCK_CLOSE
+        self._connected_evt.clear()
 
-    def on_pong(self, message):
-        """Socket on_pong event"""
-        _LOGGER.debug("RyobiApi (WSS) Got a Pong")
-
-    def on_open(self, ws):
+    async def on_open(self):
         """Socket "On_Open" event"""
         _LOGGER.debug("RyobiApi (WSS) Connexion established OK")
+        await self.authenticate()
+        await self.subscribe()
         self.socket_state = SOCK_CONNECTED
+        self._connected_evt.set()
 
-    def on_message(self, ws, message):
+    async def on_message(self, message):
         """Socket "On_Message" event"""
         self.sent_counter = 0
-        wss_data = json.loads(message)
-        _LOGGER.debug("RyobiApi (WSS) Msg received %s", wss_data)
-
-        # TODO deal with incoming messages and updates
+        self._session_healthy = True
+        try:
+            wss_data = json_loads(message)
+        except ValueError:
+            _LOGGER.warning("RyobiApi (WSS) Ignoring malformed message: %s", message)
+            return
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("RyobiApi (WSS) Msg received %s", wss_data)
+
+        if not isinstance(wss_data, dict):
+            return
+        params = wss_data.get("params")
+        if not isinstance(params, dict) or params.get("varName") is None:
+            return
+        for sub in self.subscriber:
+            if sub.device_id == params["varName"]:
+                # A bad update must not drop the websocket shared by all devices
+                try:
+                    sub.update(wss_data)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "RyobiApi (WSS) Error updating device %s", sub.device_id
+                    )
 
     async def publish_wss(self, dict_message):
         """
         Publish payload over WSS connexion
         """
-        json_message = json.dumps(dict_message)
-        _LOGGER.debug("RyobiApi (WSS) Publishing message : %s", json_message)
+        json_message = json_dumps(dict_message)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("RyobiApi (WSS) Publishing message : %s", json_message)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + PUBLISH_TIMEOUT
 
         if self.sent_counter >= 5:
             _LOGGER.warning(
                 "RyobiApi (WSS) Link is UP, but server has stopped answering request. "
             )
             self.sent_counter = 0
-            self.ws.close()
-            self.socket_state = SOCK_CLOSE
+            # Dropping the link is immediate, only the reconnect wait uses the budget
+            await self.reconnect(min(WSS_CONNECT_TIMEOUT, deadline - loop.time()))
 
         for attempt in range(N_RETRY):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
             if self.socket_state == SOCK_CONNECTED:
                 try:
-                    self.ws.send(json_message)
+                    await asyncio.wait_for(
+                        self.ws.send(json_message), timeout=min(ACK_TIMEOUT, remaining)
+                    )
                     self.sent_counter += 1
-                    _LOGGER.debug("RyobiApi (WSS) Msg published OK (%s)", attempt)
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("RyobiApi (WSS) Msg published OK (%s)", attempt)
                     return True
-                except websocket.WebSocketConnectionClosedException as err:
+                except websockets.ConnectionClosed as err:
                     self.socket_state = SOCK_CLOSE
+                    self._connected_evt.clear()
                     _LOGGER.debug(
                         "RyobiApi (WSS) Error while publishing message (details: %s)",
                         err,
                     )
+                except asyncio.TimeoutError:
+                    _LOGGER.debug(
+                        "RyobiApi (WSS) Timed out publishing message after %ss",
+                        ACK_TIMEOUT,
+                    )
+                    self._drop_ws()
             else:
                 _LOGGER.debug(
                     "RyobiApi (WSS) Can't publish message socket_state= %s, reconnecting... ",
                     self.socket_state,
                 )
-                await self.connect_wss()
+                if await self.connect_wss(min(WSS_CONNECT_TIMEOUT, remaining)):
+                    # Reconnected, retry the send straight away
+                    continue
+
+            if attempt < N_RETRY - 1:
+                delay = retry_delay(attempt)
+                if delay >= deadline - loop.time():
+                    # No time left for another attempt after backing off
+                    break
+                await asyncio.sleep(delay)
 
         _LOGGER.error(
             "RyobiApi (WSS) Failed to puslish message after %s retry. ", N_RETRY